@@ -1,11 +1,23 @@
 
-import requests
-from bs4 import BeautifulSoup
-import PyPDF2
+import asyncio
+import contextlib
+import hashlib
+import httpx
+import itertools
+import random
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from selectolax.parser import HTMLParser
+import pypdfium2 as pdfium
 import os
 import re
 from docx import Document
-from urllib.parse import urlparse
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from lxml import etree
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 from youtube_transcript_api._api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
 
@@ -13,17 +25,59 @@ from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisable
 DOWNLOADS_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
 TEMP_DIR = os.path.join(DOWNLOADS_DIR, "temp")
 OUTPUT_DOC_NAME = "Generated_Snippets.docx"
+YOUTUBE_OEMBED_URL = "https://www.youtube.com/oembed"
+MAX_CONCURRENT_REQUESTS = 64
+HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+MAX_CONTENT_CHARS = 8192 # Only the start of each document is summarized, so extraction stops here
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024 # 1 MiB per read/write when saving downloads
 
 import google.generativeai as genai
 
+# --- Data Model ---
+
+@dataclass(slots=True)
+class UrlData:
+    """Processing state and results for a single source URL."""
+    source_url: str
+    status: str = "Pending"
+    content_type: str = ""
+    raw_content: str = ""
+    title: str = ""
+    initial_summary: str = ""
+    seo_keywords: list[str] = field(default_factory=list)
+    final_summary: str = ""
+    error_message: str = ""
+
 # --- AI Generation ---
 
+WORD_RE = re.compile(r'\S+')
+
+def first_words(text, count):
+    """Returns the first `count` words of text without splitting the whole string."""
+    return [match.group() for match in itertools.islice(WORD_RE.finditer(text), count)]
+
+def join_limited(parts, separator, max_chars=None):
+    """
+    Joins parts with separator, stopping as soon as max_chars characters have
+    been collected so the rest of a lazy iterable is never produced.
+    """
+    if max_chars is None:
+        return separator.join(parts)
+    collected = []
+    length = 0
+    for part in parts:
+        collected.append(part)
+        length += len(part) + len(separator)
+        if length >= max_chars:
+            break
+    return separator.join(collected)[:max_chars]
+
 def get_ai_summary(content):
     """Generates a 60-word summary using an LLM."""
     # This is a placeholder. In a real scenario, you would use an LLM API.
     # For this example, we'll simulate the summary by truncating the content.
-    words = content.split()
-    summary = ' '.join(words[:60]) + '...'
+    words = first_words(content, 60)
+    summary = ' '.join(words) + '...'
     return summary
 
 def get_seo_keywords(title):
@@ -57,25 +111,59 @@ def rewrite_summary_with_seo(summary, keywords):
 
 # --- Output Generation ---
 
-def save_as_word_doc(data, output_filename):
-    """Saves the processed data to a Microsoft Word document."""
-    doc = Document()
-    doc.add_heading('AI Generated Snippets', level=1)
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
 
+def make_paragraph(text=None, style_id=None, page_break=False):
+    """
+    Builds a <w:p> element directly with lxml, bypassing python-docx's
+    per-call proxy objects. Newlines in text become line breaks, as with
+    Document.add_paragraph.
+    """
+    p = OxmlElement('w:p')
+    if style_id:
+        p_pr = etree.SubElement(p, qn('w:pPr'))
+        etree.SubElement(p_pr, qn('w:pStyle')).set(qn('w:val'), style_id)
+    r = etree.SubElement(p, qn('w:r'))
+    if page_break:
+        etree.SubElement(r, qn('w:br')).set(qn('w:type'), 'page')
+        return p
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            etree.SubElement(r, qn('w:br'))
+        t = etree.SubElement(r, qn('w:t'))
+        t.text = line
+        t.set(XML_SPACE, 'preserve')
+    return p
+
+def append_snippets(doc, data):
+    """Appends the heading/paragraph blocks for every processed item to the document body in one pass."""
+    elements = []
     for item in data:
-        if item["status"] == "Processed":
-            doc.add_heading(f"URL: {item['source_url']}", level=2)
+        if item.status == "Processed":
+            elements.append(make_paragraph(f"URL: {item.source_url}", 'Heading2'))
             
-            doc.add_heading('Title', level=3)
-            doc.add_paragraph(item["title"])
+            elements.append(make_paragraph('Title', 'Heading3'))
+            elements.append(make_paragraph(item.title))
             
-            doc.add_heading('SEO Keywords', level=3)
-            doc.add_paragraph(', '.join(item["seo_keywords"]))
+            elements.append(make_paragraph('SEO Keywords', 'Heading3'))
+            elements.append(make_paragraph(', '.join(item.seo_keywords)))
             
-            doc.add_heading('Final Summary', level=3)
-            doc.add_paragraph(item["final_summary"])
+            elements.append(make_paragraph('Final Summary', 'Heading3'))
+            elements.append(make_paragraph(item.final_summary))
             
-            doc.add_page_break()
+            elements.append(make_paragraph(page_break=True))
+
+    # Section properties must remain the last child of <w:body>
+    body = doc.element.body
+    sect_pr = body.sectPr
+    index = body.index(sect_pr) if sect_pr is not None else len(body)
+    body[index:index] = elements
+
+def save_as_word_doc(data, output_filename):
+    """Saves the processed data to a Microsoft Word document."""
+    doc = Document()
+    doc.add_heading('AI Generated Snippets', level=1)
+    append_snippets(doc, data)
 
     try:
         doc.save(output_filename)
@@ -84,69 +172,265 @@ def save_as_word_doc(data, output_filename):
         print(f"\nError saving Word document: {e}")
 
 
+# --- HTTP Rate Limiting ---
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 30
+
+class HostRateLimiter:
+    """
+    Per-host token bucket. Each host starts with `capacity` tokens which refill
+    at `rate` tokens per second; the rate is tuned from rate-limit headers.
+    """
+
+    def __init__(self, rate=10.0, capacity=10):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}  # host -> (tokens, last_refill)
+        self.rates = {}  # host -> refill rate learned from response headers
+
+    async def acquire(self, host):
+        """Waits until a token is available for the host, then consumes it."""
+        while True:
+            rate = self.rates.get(host, self.rate)
+            now = time.monotonic()
+            tokens, last_refill = self.buckets.get(host, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * rate)
+            if tokens >= 1:
+                self.buckets[host] = (tokens - 1, now)
+                return
+            self.buckets[host] = (tokens, now)
+            await asyncio.sleep((1 - tokens) / rate)
+
+    def pause(self, host, seconds):
+        """Drains the host's bucket so no request is issued for `seconds`."""
+        rate = self.rates.get(host, self.rate)
+        self.buckets[host] = (1 - seconds * rate, time.monotonic())
+
+    def update_from_headers(self, host, headers):
+        """Tunes the host's refill rate from X-RateLimit-* response headers."""
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+        # The reset value is either an epoch timestamp or seconds until reset
+        window = reset - time.time() if reset > 1e9 else reset
+        if window <= 0:
+            return
+        if remaining <= 0:
+            self.pause(host, min(window, MAX_BACKOFF_SECONDS))
+        else:
+            self.rates[host] = max(remaining / window, 0.1)
+
+def parse_retry_after(headers):
+    """Returns the Retry-After delay in seconds, or None if absent/invalid."""
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+rate_limiter = HostRateLimiter()
+
+@contextlib.asynccontextmanager
+async def request_with_retry(client, method, url, limiter=rate_limiter, **kwargs):
+    """
+    Issues a streaming HTTP request through the per-host rate limiter,
+    retrying 429/5xx responses with exponential backoff. Raises
+    httpx.HTTPStatusError for any other error status. Use as
+    `async with request_with_retry(...) as response:`; the response is
+    closed on exit, so read the body inside the block.
+    """
+    host = urlparse(url).netloc
+    for attempt in range(MAX_RETRIES):
+        await limiter.acquire(host)
+        request = client.build_request(method, url, **kwargs)
+        response = await client.send(request, stream=True)
+        limiter.update_from_headers(host, response.headers)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            await response.aclose()
+            if e.response.status_code not in RETRYABLE_STATUSES or attempt == MAX_RETRIES - 1:
+                raise
+            delay = parse_retry_after(response.headers)
+            if delay is None:
+                delay = 2 ** attempt + random.random()
+            delay = min(delay, MAX_BACKOFF_SECONDS)
+            limiter.pause(host, delay)
+            await asyncio.sleep(delay)
+            continue
+        try:
+            yield response
+        finally:
+            await response.aclose()
+        return
+
+
 # --- Core Agent Functions ---
 
 
-def get_content_type(url):
-    """Checks if a URL points to a PDF, a web page, or a YouTube video."""
+def content_type_from_url(url):
+    """Returns 'youtube' or 'pdf' when the URL alone identifies its content type, otherwise None."""
     if extract_video_id_from_url(url):
         return 'youtube'
-    if url.lower().endswith('.pdf'):
+    if urlparse(url).path.lower().endswith('.pdf'):
         return 'pdf'
+    return None
+
+def normalize_url(url):
+    """
+    Returns a canonical form of a URL for de-duplication: surrounding
+    whitespace, the fragment and query-parameter order are ignored, and the
+    scheme and host are lowercased.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+def dedupe_urls(urls):
+    """Drops blank entries and URLs that normalize to one already seen, preserving order."""
+    unique = {}
+    for url in urls:
+        if url.strip():
+            unique.setdefault(normalize_url(url), url.strip())
+    return list(unique.values())
+
+# Content types learned from HEAD requests, keyed by normalized URL, least recently used first
+content_type_cache = OrderedDict()
+CONTENT_TYPE_CACHE_SIZE = 4096
+
+async def probe_content_type(client, url, log):
+    """Issues a HEAD request to tell PDFs from web pages."""
     try:
-        response = requests.head(url, allow_redirects=True, timeout=10)
-        content_type = response.headers.get('Content-Type', '').lower()
-        if 'application/pdf' in content_type:
-            return 'pdf'
-        return 'html'
-    except requests.RequestException:
-        try:
-            response = requests.get(url, stream=True, timeout=10)
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'application/pdf' in content_type:
-                return 'pdf'
-            return 'html'
-        except requests.RequestException:
+        async with request_with_retry(client, 'HEAD', url, timeout=10) as response:
+            header = response.headers.get('Content-Type', '').lower()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in RETRYABLE_STATUSES:
+            log(f"HEAD request failed for {url}: {e}")
             return 'error'
-
-def extract_html_content(url):
-    """Fetches and extracts the title and main content from a web page."""
+        # e.g. HEAD is unsupported (405/501) or refused; treat it as a web page
+        # and let the GET report any real error
+        header = ''
+    except httpx.HTTPError as e:
+        # No GET fallback: it would start downloading the whole body just to read one header
+        log(f"HEAD request failed for {url}: {str(e) or type(e).__name__}")
+        return 'error'
+    return 'pdf' if 'application/pdf' in header else 'html'
+
+async def get_content_type(client, url, log=print):
+    """Checks if a URL points to a PDF, a web page, or a YouTube video."""
+    content_type = content_type_from_url(url)
+    if content_type:
+        return content_type
+    key = normalize_url(url)
+    if key in content_type_cache:
+        content_type_cache.move_to_end(key)
+        return content_type_cache[key]
+
+    content_type = await probe_content_type(client, url, log)
+    if content_type != 'error':
+        content_type_cache[key] = content_type
+        if len(content_type_cache) > CONTENT_TYPE_CACHE_SIZE:
+            content_type_cache.popitem(last=False)
+    return content_type
+
+# Candidate main-content containers, most preferred first
+MAIN_CONTENT_SELECTORS = ('article', 'main', 'div.content', 'div#content')
+
+def main_content_rank(node):
+    """Returns the index in MAIN_CONTENT_SELECTORS of a node matched by one of them."""
+    if node.tag == 'article':
+        return 0
+    if node.tag == 'main':
+        return 1
+    if 'content' in (node.attributes.get('class') or '').split():
+        return 2
+    return 3
+
+def find_main_content(tree):
+    """
+    Returns the first node matching the most preferred MAIN_CONTENT_SELECTORS
+    entry, or None. All candidates are collected in a single tree walk rather
+    than one css_first() walk per selector.
+    """
+    best, best_rank = None, len(MAIN_CONTENT_SELECTORS)
+    for node in tree.css(', '.join(MAIN_CONTENT_SELECTORS)):
+        rank = main_content_rank(node)
+        if rank < best_rank:
+            best, best_rank = node, rank
+            if rank == 0:
+                break
+    return best
+
+async def extract_html_content(client, url, max_chars=MAX_CONTENT_CHARS):
+    """Fetches and extracts the title and the first max_chars of main content from a web page."""
     try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        async with request_with_retry(client, 'GET', url, timeout=15) as response:
+            body = await response.aread()
+        tree = HTMLParser(body)
+        tree.strip_tags(['script', 'style']) # Their contents aren't readable text
         
-        title = soup.find('title').get_text(strip=True) if soup.find('title') else "No Title Found"
+        title_node = tree.css_first('title')
+        title = title_node.text(strip=True) if title_node else "No Title Found"
         
         # A simple strategy to find the main content
-        main_content = soup.find('article') or soup.find('main') or soup.find('div', class_='content') or soup.find('div', id='content')
+        main_content = find_main_content(tree)
         if main_content:
-            content_text = main_content.get_text('\n', strip=True)
+            content_text = main_content.text(separator='\n', strip=True)
         else:
-            content_text = soup.get_text('\n', strip=True) # Fallback to all text
+            content_text = (tree.body or tree.root).text(separator='\n', strip=True) # Fallback to all text
             
-        return title, content_text, None
-    except requests.RequestException as e:
-        return None, None, str(e)
+        return title, content_text[:max_chars], None
+    except httpx.HTTPError as e:
+        return None, None, str(e) or type(e).__name__
 
-def extract_youtube_content(url):
-    """Fetches the transcript and title from a YouTube video."""
+def fetch_transcript(video_id, max_chars=None):
+    """Fetches the English transcript of a YouTube video as plain text, up to max_chars."""
+    transcript_list = YouTubeTranscriptApi().list(video_id)
+    transcript = transcript_list.find_transcript(['en'])
+    return join_limited((item.text for item in transcript.fetch()), " ", max_chars)
+
+async def fetch_youtube_title(client, url):
+    """
+    Returns the title of a YouTube video. The oEmbed endpoint answers with a
+    few hundred bytes of JSON, so the full watch page is only scraped if it fails.
+    """
+    try:
+        params = {"url": url, "format": "json"}
+        async with request_with_retry(client, 'GET', YOUTUBE_OEMBED_URL, params=params, timeout=5) as response:
+            await response.aread()
+            oembed = response.json()
+        if oembed.get("title"):
+            return oembed["title"]
+    except (httpx.HTTPError, ValueError):
+        pass
+
+    # Fall back to scraping og:title from the watch page
+    async with request_with_retry(client, 'GET', url, timeout=15) as response:
+        body = await response.aread()
+    title = HTMLParser(body).css_first('meta[property="og:title"]')
+    title = title.attributes.get('content') if title else None
+    return title or "No Title Found"
+
+async def extract_youtube_content(client, url, max_chars=MAX_CONTENT_CHARS):
+    """Fetches the title and the first max_chars of transcript from a YouTube video."""
     try:
         video_id = extract_video_id_from_url(url)
         if not video_id:
             return None, None, "Invalid YouTube URL"
 
-        # Get transcript
-        transcript_list = YouTubeTranscriptApi().list(video_id)
-        transcript = transcript_list.find_transcript(['en'])
-        transcript_text = " ".join([item.text for item in transcript.fetch()])
+        # youtube-transcript-api is blocking, so run it off the event loop
+        transcript_text = await asyncio.to_thread(fetch_transcript, video_id, max_chars)
 
-        # Scrape title from YouTube page
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        title = soup.find('meta', property='og:title')
-        title = title['content'] if title else "No Title Found"
+        title = await fetch_youtube_title(client, url)
 
         return title, transcript_text, None
     except NoTranscriptFound:
@@ -154,154 +438,216 @@ def extract_youtube_content(url):
     except TranscriptsDisabled:
         return None, None, "Transcripts are disabled for this video."
     
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         return None, None, f"Failed to fetch YouTube page: {e}"
     except Exception as e:
         return None, None, f"An unexpected error occurred: {e}"
 
 
 
-def download_pdf(url, folder):
-    """Downloads a PDF from a URL into a specified folder."""
+def pdf_download_path(url, folder):
+    """
+    Returns where to save the PDF at a URL: its own file name, inside a
+    subfolder named after the normalized URL, so concurrent downloads of
+    different URLs ending in the same name can't overwrite each other.
+    """
+    filename = os.path.basename(urlparse(url).path) or "document"
+    if not filename.lower().endswith('.pdf'):
+        filename += ".pdf"
+    subfolder = os.path.join(folder, hashlib.sha256(normalize_url(url).encode()).hexdigest()[:16])
+    os.makedirs(subfolder, exist_ok=True)
+    return os.path.join(subfolder, filename)
+
+async def download_pdf(client, url, folder, progress_cb=None):
+    """
+    Downloads a PDF from a URL into a specified folder. If given,
+    progress_cb(bytes_written, content_length) is called after each chunk;
+    content_length is 0 when the server doesn't send one.
+    """
     try:
-        response = requests.get(url, stream=True, timeout=20)
-        response.raise_for_status()
-        
-        # Get a filename from the URL
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-        if not filename.lower().endswith('.pdf'):
-            filename += ".pdf"
+        async with request_with_retry(client, 'GET', url, timeout=20) as response:
             
-        filepath = os.path.join(folder, filename)
-        
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            filepath = pdf_download_path(url, folder)
+            content_length = int(response.headers.get('Content-Length') or 0)
+            bytes_written = 0
+            with open(filepath, 'wb') as f:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    bytes_written += len(chunk)
+                    if progress_cb:
+                        progress_cb(bytes_written, content_length)
         return filepath, None
-    except requests.RequestException as e:
-        return None, str(e)
+    except httpx.HTTPError as e:
+        return None, str(e) or type(e).__name__
 
-def extract_pdf_content(filepath):
-    """Extracts title and text content from a local PDF file."""
+def read_page_text(pdf, index):
+    """Returns the text of one page of an open pypdfium2 document, releasing its handles."""
+    page = pdf[index]
+    textpage = page.get_textpage()
     try:
-        with open(filepath, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+def iter_pdf_pages(pdf):
+    """
+    Yields the text of each page of an open PDF in order, so callers can
+    consume a document page by page instead of holding all of it at once.
+    """
+    for i in range(len(pdf)):
+        yield read_page_text(pdf, i)
+
+def extract_pdf_text(pdf, max_chars=None):
+    """Returns the text of an open PDF's pages joined with newlines, stopping after max_chars."""
+    return join_limited(iter_pdf_pages(pdf), "\n", max_chars)
+
+def extract_pdf_content(filepath, max_chars=MAX_CONTENT_CHARS):
+    """Extracts title and the first max_chars of text content from a local PDF file."""
+    try:
+        pdf = pdfium.PdfDocument(filepath)
+        try:
             # Try to get title from metadata
-            metadata = reader.metadata
-            title = metadata.title if metadata and metadata.title else "No Title Found"
+            title = pdf.get_metadata_dict().get("Title") or "No Title Found"
 
             # If no title in metadata, use the filename as a fallback
             if not title or title == "No Title Found":
                 title = os.path.basename(filepath).replace('_', ' ').replace('-', ' ').rsplit('.', 1)[0]
 
-            content_text = ""
-            for page in reader.pages:
-                content_text += page.extract_text() + "\n"
+            content_text = extract_pdf_text(pdf, max_chars)
                 
             return title, content_text, None
+        finally:
+            pdf.close()
     except Exception as e:
         return None, None, str(e)
 
-def process_urls(urls):
+async def fetch_url(client, semaphore, url):
     """
-    Main function to process a list of URLs and generate snippets.
+    Determines the content type of a single URL and fetches its content.
+    Returns the url_data dict and, for PDFs, the path of the downloaded file.
     """
-    if not os.path.exists(TEMP_DIR):
-        os.makedirs(TEMP_DIR)
-
-    processed_data = []
-    pdf_files_to_process = []
-
-    for url in urls:
+    async with semaphore:
         print(f"Processing URL: {url}")
-        content_type = get_content_type(url)
+        content_type = await get_content_type(client, url)
         
-        url_data = {
-            "source_url": url,
-            "status": "Pending",
-            "content_type": content_type,
-            "raw_content": "",
-            "title": "",
-            "initial_summary": "",
-            "seo_keywords": [],
-            "final_summary": "",
-            "error_message": ""
-        }
+        url_data = UrlData(source_url=url, content_type=content_type)
+        filepath = None
 
         if content_type == 'html':
-            print("Type: Web Page")
-            title, content, error = extract_html_content(url)
+            print(f"Type: Web Page ({url})")
+            title, content, error = await extract_html_content(client, url)
             if error:
-                url_data["status"] = "Error"
-                url_data["error_message"] = error
+                url_data.status = "Error"
+                url_data.error_message = error
             else:
-                url_data["title"] = title
-                url_data["raw_content"] = content
-                url_data["status"] = "Content Extracted"
+                url_data.title = title
+                url_data.raw_content = content
+                url_data.status = "Content Extracted"
         elif content_type == 'youtube':
-            print("Type: YouTube Video")
-            title, content, error = extract_youtube_content(url)
+            print(f"Type: YouTube Video ({url})")
+            title, content, error = await extract_youtube_content(client, url)
             if error:
-                url_data["status"] = "Error"
-                url_data["error_message"] = error
+                url_data.status = "Error"
+                url_data.error_message = error
             else:
-                url_data["title"] = title
-                url_data["raw_content"] = content
-                url_data["status"] = "Content Extracted"
+                url_data.title = title
+                url_data.raw_content = content
+                url_data.status = "Content Extracted"
         elif content_type == 'pdf':
-            print("Type: PDF Document")
-            filepath, error = download_pdf(url, TEMP_DIR)
+            print(f"Type: PDF Document ({url})")
+            filepath, error = await download_pdf(client, url, TEMP_DIR)
             if error:
-                url_data["status"] = "Error"
-                url_data["error_message"] = f"Failed to download PDF: {error}"
+                url_data.status = "Error"
+                url_data.error_message = f"Failed to download PDF: {error}"
             else:
                 print(f"PDF downloaded to: {filepath}")
-                # We will process the PDF content after the initial loop
-                pdf_files_to_process.append((url_data, filepath))
-                url_data["status"] = "Downloaded"
+                # We will process the PDF content after all downloads finish
+                url_data.status = "Downloaded"
 
         else:
-            print("Type: Unknown or Error")
-            url_data["status"] = "Error"
-            url_data["error_message"] = "Could not determine content type or URL is unreachable."
+            print(f"Type: Unknown or Error ({url})")
+            url_data.status = "Error"
+            url_data.error_message = "Could not determine content type or URL is unreachable."
+
+        return url_data, filepath
+
+async def fetch_urls(urls):
+    """
+    Fetches all URLs concurrently over a shared HTTP/2 client, so requests to
+    the same host reuse one connection.
+    Results are returned in the same order as the input URLs.
+    """
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    async with httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, follow_redirects=True) as client:
+        tasks = [asyncio.create_task(fetch_url(client, semaphore, url)) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
 
+def process_urls(urls):
+    """
+    Main function to process a list of URLs and generate snippets.
+    """
+    if not os.path.exists(TEMP_DIR):
+        os.makedirs(TEMP_DIR)
+
+    processed_data = []
+    pdf_files_to_process = []
+
+    unique_urls = dedupe_urls(urls)
+    if len(unique_urls) < len(urls):
+        print(f"Skipping {len(urls) - len(unique_urls)} duplicate or blank URL(s).")
+    urls = unique_urls
+
+    # Fetch phase: all network I/O runs concurrently
+    results = asyncio.run(fetch_urls(urls))
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            url_data = UrlData(
+                source_url=url,
+                status="Error",
+                content_type="error",
+                error_message=f"An unexpected error occurred: {result}"
+            )
+            filepath = None
+        else:
+            url_data, filepath = result
+        if filepath:
+            pdf_files_to_process.append((url_data, filepath))
         processed_data.append(url_data)
-        print("-" * 20)
+    print("-" * 20)
 
     # Now, process the downloaded PDFs
     for url_data, filepath in pdf_files_to_process:
         print(f"Extracting content from PDF: {filepath}")
         title, content, error = extract_pdf_content(filepath)
         if error:
-            url_data["status"] = "Error"
-            url_data["error_message"] = f"Failed to extract content from PDF: {error}"
+            url_data.status = "Error"
+            url_data.error_message = f"Failed to extract content from PDF: {error}"
         else:
-            url_data["title"] = title
-            url_data["raw_content"] = content
-            url_data["status"] = "Content Extracted"
+            url_data.title = title
+            url_data.raw_content = content
+            url_data.status = "Content Extracted"
         print("-" * 20)
 
 
     # AI Processing: Summarization, Keyword Generation, and Rewriting
     for item in processed_data:
-        if item["status"] == "Content Extracted":
-            print(f"Generating AI content for: {item['source_url']}")
+        if item.status == "Content Extracted":
+            print(f"Generating AI content for: {item.source_url}")
             
             # 1. Initial Summary
-            item["initial_summary"] = get_ai_summary(item["raw_content"])
+            item.initial_summary = get_ai_summary(item.raw_content)
             
             # Clear raw content to save memory
-            item["raw_content"] = ""
+            item.raw_content = ""
             
             # 2. SEO Keywords
-            item["seo_keywords"] = get_seo_keywords(item["title"])
+            item.seo_keywords = get_seo_keywords(item.title)
             
             # 3. Final Summary
-            item["final_summary"] = rewrite_summary_with_seo(item["initial_summary"], item["seo_keywords"])
+            item.final_summary = rewrite_summary_with_seo(item.initial_summary, item.seo_keywords)
             
-            item["status"] = "Processed"
+            item.status = "Processed"
             print("AI content generated.")
         print("-" * 20)
 
@@ -311,7 +657,7 @@ def process_urls(urls):
 
     print("\nFinal Processed Data:")
     import json
-    print(json.dumps(processed_data, indent=2))
+    print(json.dumps([asdict(item) for item in processed_data], indent=2))
 
 
 # --- Main Execution ---
@@ -1,6 +1,11 @@
 import sys
 import os
 import time
+import asyncio
+import hashlib
+import json
+import re
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -9,15 +14,29 @@ from PyQt6.QtWidgets import (
 
 # --- Import Agent Logic ---
 # The following functions are copied and adapted from agent.py
-import requests
-from bs4 import BeautifulSoup
-import PyPDF2
+import httpx
+import diskcache
+from selectolax.parser import HTMLParser
+import pypdfium2 as pdfium
 from docx import Document
 from urllib.parse import urlparse, parse_qs
-from youtube_transcript_api import YouTubeTranscriptApi
+
+from agent import (
+    DOWNLOAD_CHUNK_SIZE, HTTP_LIMITS, MAX_CONCURRENT_REQUESTS, MAX_CONTENT_CHARS, append_snippets,
+    dedupe_urls, extract_pdf_text, fetch_transcript, fetch_youtube_title, find_main_content,
+    first_words, get_content_type, pdf_download_path, rate_limiter, request_with_retry,
+    UrlData
+)
 
 import google.generativeai as genai
 
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError: # The semantic cache is optional
+    faiss = None
+
 # --- AI Model Initialization ---
 
 def initialize_ai():
@@ -42,57 +61,219 @@ def initialize_ai():
 DOWNLOADS_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
 TEMP_DIR = os.path.join(DOWNLOADS_DIR, "temp")
 OUTPUT_DOC_NAME = "Generated_Snippets.docx"
+MAX_CONCURRENT_AI_CALLS = 8
+GEMINI_API_HOST = "generativelanguage.googleapis.com" # Rate-limiter key for model calls
+SNIPPET_PROMPT_WORDS = 1000 # Content words sent to the model for each snippet; MAX_CONTENT_CHARS covers this much typical prose
+
+# --- AI Response Cache ---
+LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".snippets_agent_cache")
+LLM_CACHE_TTL = 7 * 86400 # One week, in seconds
+llm_cache = diskcache.Cache(LLM_CACHE_DIR)
+
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92 # Minimum cosine similarity to reuse a response
+
+class SemanticCache:
+    """
+    In-memory cache that reuses responses for semantically similar inputs,
+    e.g. "Google Gemini AI" and "Google's Gemini AI". Inputs are embedded with
+    a local sentence-transformers model and matched against a FAISS index.
+    Disabled when faiss/sentence-transformers are not installed. lookup()
+    blocks on the model, so async callers run it in a worker thread.
+    """
+    encoder = None # Shared by all instances, loaded on first use
+    encoder_lock = threading.Lock()
+
+    def __init__(self, threshold=SEMANTIC_CACHE_THRESHOLD):
+        self.threshold = threshold
+        self.enabled = faiss is not None
+        self.index = None
+        self.responses = []
+        self.lock = threading.Lock() # The FAISS index isn't safe to search and add to at once
+
+    def embed(self, text):
+        with SemanticCache.encoder_lock:
+            if SemanticCache.encoder is None:
+                SemanticCache.encoder = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+        # Normalized embeddings make inner product equal to cosine similarity
+        embedding = SemanticCache.encoder.encode([text], normalize_embeddings=True)
+        return np.asarray(embedding, dtype='float32')
+
+    def lookup(self, text):
+        """Returns (cached response or None, embedding of text) for the nearest prior input."""
+        if not self.enabled:
+            return None, None
+        try:
+            embedding = self.embed(text)
+        except Exception:
+            # e.g. the embedding model could not be downloaded; keep exact-match caching only
+            self.enabled = False
+            return None, None
+        with self.lock:
+            if self.index is not None and self.index.ntotal:
+                scores, ids = self.index.search(embedding, 1)
+                if scores[0][0] >= self.threshold:
+                    return self.responses[ids[0][0]], embedding
+        return None, embedding
+
+    def add(self, embedding, response):
+        if embedding is None:
+            return
+        with self.lock:
+            if self.index is None:
+                self.index = faiss.IndexFlatIP(embedding.shape[1])
+            self.index.add(embedding)
+            self.responses.append(response)
+
+# Only the get_seo_keywords fallback uses this; structured snippets depend on the content, and
+# rewrite prompts can match while their summaries differ, so both are exact-match only
+keyword_cache = SemanticCache()
+
+async def generate_cached(model, prompt, semantic_cache=None, semantic_text=None, generation_config=None, cache_text=None, parse=None):
+    """
+    Returns the model's response text for a prompt, serving repeats from the
+    on-disk cache and, if a semantic cache is given, near-duplicates of
+    `semantic_text` (defaults to the prompt) from it. `cache_text` replaces
+    the prompt in the on-disk cache key, for callers that normalize inputs.
+    If given, `parse` is applied to the text and its result returned instead;
+    a response it rejects with ValueError is never cached.
+    """
+    key = hashlib.sha256(f"{model.model_name}|{cache_text or prompt}".encode()).hexdigest()
+    cached = llm_cache.get(key)
+    if cached is not None:
+        if parse is None:
+            return cached
+        try:
+            return parse(cached)
+        except ValueError:
+            llm_cache.delete(key) # Stored before this response was validated; fetch a fresh one
+    embedding = None
+    if semantic_cache is not None:
+        cached, embedding = await asyncio.to_thread(semantic_cache.lookup, semantic_text or prompt)
+        if cached is not None:
+            return cached if parse is None else parse(cached)
+    await rate_limiter.acquire(GEMINI_API_HOST)
+    response = await model.generate_content_async(prompt, generation_config=generation_config)
+    text = response.text
+    result = text if parse is None else parse(text)
+    llm_cache.set(key, text, expire=LLM_CACHE_TTL)
+    if semantic_cache is not None:
+        semantic_cache.add(embedding, text)
+    return result
 
 # --- AI Generation (Placeholders) ---
 def get_ai_summary(content):
-    words = content.split()
-    summary = ' '.join(words[:60]) + '...'
+    words = first_words(content, 60)
+    summary = ' '.join(words) + '...'
     return summary
 
-def get_seo_keywords(model, title):
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_title(title):
+    """Canonical form of a title for cache lookups: lowercase, no punctuation, single spaces."""
+    return WHITESPACE_RE.sub(' ', PUNCTUATION_RE.sub('', title.lower())).strip()
+
+async def get_seo_keywords(model, title):
     """Generates SEO keywords from a title using the Gemini API."""
     if not model:
         return ['AI model not initialized']
     try:
         prompt = f"Give top 5 SEO Keywords for \"{title}\". Return as a comma-separated list."
-        response = model.generate_content(prompt)
+        # "Google Gemini AI" and "Google Gemini AI!" share one cache entry
+        normalized = normalize_title(title)
+        response_text = await generate_cached(
+            model, prompt, keyword_cache, normalized, cache_text=f"seo_keywords|{normalized}"
+        )
         # Basic parsing, assuming the model returns a comma-separated string
-        keywords = [kw.strip() for kw in response.text.split(',')]
+        keywords = [kw.strip() for kw in response_text.split(',')]
         return keywords
     except Exception as e:
         return [f"Error generating keywords: {e}"]
 
-import re
+# Common markdown characters stripped from model output
+MARKDOWN_STRIP_RE = re.compile(r'[*_`#\[\]()]+')
 
-def rewrite_summary_with_seo(model, summary, keywords):
+async def rewrite_summary_with_seo(model, summary, keywords):
     """Rewrites a summary to include SEO keywords using the Gemini API."""
     if not model:
         return summary + " (Keywords: " + ', '.join(keywords) + ")" # Fallback
     try:
         kw_string = ", ".join(keywords)
         prompt = f"Rewrite the following summary to naturally include these SEO keywords: '{kw_string}'.\n\nSummary: '{summary}'\n\nDo not include any markdown formatting in your response."
-        response = model.generate_content(prompt)
+        response_text = await generate_cached(model, prompt)
         # Remove common markdown characters
-        clean_text = re.sub(r'[*_`#\[\]()]+', '', response.text)
+        clean_text = MARKDOWN_STRIP_RE.sub('', response_text)
         return clean_text.strip()
     except Exception as e:
         return summary + f" (Error rewriting summary: {e})"
 
+def parse_snippet(response_text):
+    """Parses a structured snippet response, raising ValueError if it is malformed."""
+    try:
+        result = json.loads(response_text)
+        summary, keywords, rewritten = result["summary"], result["keywords"], result["rewritten_summary"]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Malformed snippet response: {e!r}") from e
+    # JSON mode has no schema, so check the types the model actually returned
+    if not isinstance(summary, str) or not isinstance(rewritten, str):
+        raise ValueError("Malformed snippet response: summaries must be strings")
+    if not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords):
+        raise ValueError("Malformed snippet response: keywords must be a list of strings")
+    return {
+        "summary": summary.strip(),
+        "keywords": [kw.strip() for kw in keywords],
+        "final_summary": MARKDOWN_STRIP_RE.sub('', rewritten).strip(),
+    }
+
+async def generate_snippet(model, title, content):
+    """
+    Generates the summary, SEO keywords and SEO-rewritten summary for one item
+    in a single structured-output Gemini call. Returns None if the model is not
+    initialized or the response can't be parsed, so the caller can fall back
+    to the step-by-step prompts. API errors (quota, rate limits, outages) are
+    raised rather than retried as three separate calls.
+    """
+    if not model:
+        return None
+    excerpt = ' '.join(first_words(content, SNIPPET_PROMPT_WORDS))
+    prompt = (
+        f"Given the title \"{title}\" and the content below, return a JSON object with these fields:\n"
+        "- \"summary\": a 60-word summary of the content\n"
+        "- \"keywords\": a list of the top 5 SEO keywords for the title\n"
+        "- \"rewritten_summary\": the summary rewritten to naturally include those keywords, without any markdown formatting\n\n"
+        f"Content: '{excerpt}'"
+    )
+    try:
+        # Titles differing only in case or punctuation share one cache entry for the same content
+        return await generate_cached(
+            model, prompt, generation_config={"response_mime_type": "application/json"},
+            cache_text=f"snippet|{normalize_title(title)}|{excerpt}", parse=parse_snippet
+        )
+    except ValueError: # Includes json.JSONDecodeError
+        return None
+
 # --- Agent Worker Thread ---
 class AgentWorker(QThread):
     """Runs the snippet generation in a separate thread."""
     progress_update = pyqtSignal(int)
+    byte_progress = pyqtSignal(str, int, int) # url, bytes written, content length (0 if unknown)
     log_update = pyqtSignal(str)
     finished = pyqtSignal(str) # Emits the path of the output file
 
     def __init__(self, urls):
         super().__init__()
-        self.urls = urls
+        self.urls = dedupe_urls(urls)
+        self.skipped_urls = len(urls) - len(self.urls)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
+        # One pooled HTTP/2 client for the whole run; it is closed when fetch_urls() finishes
+        self.client = httpx.AsyncClient(
+            http2=True, limits=HTTP_LIMITS, headers=self.headers, follow_redirects=True
+        )
 
     def run(self):
         # --- Initialize AI Model ---
@@ -108,113 +289,164 @@ class AgentWorker(QThread):
 
         processed_data = []
         pdf_files_to_process = []
-        total_urls = len(self.urls)
 
-        for i, url in enumerate(self.urls):
-            self.log_update.emit(f"({i+1}/{total_urls}) Processing URL: {url}")
-            content_type = self.get_content_type(url)
-            
-            url_data = {
-                "source_url": url, "status": "Pending", "content_type": content_type,
-                "raw_content": "", "title": "", "initial_summary": "",
-                "seo_keywords": [], "final_summary": "", "error_message": ""
-            }
-
-            if content_type == 'html':
-                self.log_update.emit("-> Type: Web Page")
-                title, content, error = self.extract_html_content(url)
-                if error:
-                    url_data["status"] = "Error"
-                    url_data["error_message"] = error
-                    self.log_update.emit(f"-> Error: {error}")
-                else:
-                    url_data["title"] = title
-                    url_data["raw_content"] = content
-                    url_data["status"] = "Content Extracted"
-                    self.log_update.emit("-> Content extracted successfully.")
-            elif content_type == 'pdf':
-                self.log_update.emit("-> Type: PDF Document")
-                filepath, error = self.download_pdf(url, TEMP_DIR)
-                if error:
-                    url_data["status"] = "Error"
-                    url_data["error_message"] = f"Failed to download PDF: {error}"
-                    self.log_update.emit(f"-> Error downloading PDF: {error}")
-                else:
-                    self.log_update.emit(f"-> PDF downloaded to: {filepath}")
-                    pdf_files_to_process.append((url_data, filepath))
-                    url_data["status"] = "Downloaded"
-            elif content_type == 'youtube':
-                self.log_update.emit("-> Type: YouTube Video")
-                title, content, error = self.extract_youtube_content(url)
-                if error:
-                    url_data["status"] = "Error"
-                    url_data["error_message"] = error
-                    self.log_update.emit(f"-> Error: {error}")
-                else:
-                    url_data["title"] = title
-                    url_data["raw_content"] = content
-                    url_data["status"] = "Content Extracted"
-                    self.log_update.emit("-> Content extracted successfully.")
-            else:
-                self.log_update.emit("-> Type: Unknown or Error")
-                url_data["status"] = "Error"
-                url_data["error_message"] = "Could not determine content type or URL is unreachable."
+        if self.skipped_urls:
+            self.log_update.emit(f"Skipping {self.skipped_urls} duplicate or blank URL(s).")
 
+        # Fetch phase: all network I/O runs concurrently
+        results = asyncio.run(self.fetch_urls())
+        for url, result in zip(self.urls, results):
+            if isinstance(result, Exception):
+                self.log_update.emit(f"-> Unexpected error for {url}: {result}")
+                url_data = UrlData(source_url=url, status="Error", content_type="error", error_message=str(result))
+                filepath = None
+            else:
+                url_data, filepath = result
+            if filepath:
+                pdf_files_to_process.append((url_data, filepath))
             processed_data.append(url_data)
-            self.progress_update.emit(int(((i + 1) / total_urls) * 50)) # First 50% for download/extract
 
         # Process PDFs
         for url_data, filepath in pdf_files_to_process:
             self.log_update.emit(f"Extracting content from PDF: {os.path.basename(filepath)}")
             title, content, error = self.extract_pdf_content(filepath)
             if error:
-                url_data["status"] = "Error"
-                url_data["error_message"] = f"Failed to extract content from PDF: {error}"
+                url_data.status = "Error"
+                url_data.error_message = f"Failed to extract content from PDF: {error}"
                 self.log_update.emit(f"-> Error extracting PDF content: {error}")
             else:
-                url_data["title"] = title
-                url_data["raw_content"] = content
-                url_data["status"] = "Content Extracted"
+                url_data.title = title
+                url_data.raw_content = content
+                url_data.status = "Content Extracted"
                 self.log_update.emit("-> Content extracted successfully.")
 
-        # AI Processing
-        total_items = len(processed_data)
-        for i, item in enumerate(processed_data):
-            if item["status"] == "Content Extracted":
-                self.log_update.emit(f"Generating AI content for: {item['source_url']}")
-                item["initial_summary"] = get_ai_summary(item["raw_content"])
-                item["raw_content"] = ""
-                item["seo_keywords"] = get_seo_keywords(model, item["title"])
-                item["final_summary"] = rewrite_summary_with_seo(model, item["initial_summary"], item["seo_keywords"])
-                item["status"] = "Processed"
-                self.log_update.emit("-> AI content generated.")
-            self.progress_update.emit(50 + int(((i + 1) / total_items) * 50)) # Second 50% for AI tasks
+        # AI Processing: model calls for all items run concurrently
+        asyncio.run(self.generate_ai_content(model, processed_data))
 
         # Save to Word Doc
         output_path = os.path.join(os.getcwd(), OUTPUT_DOC_NAME)
         self.save_as_word_doc(processed_data, output_path)
         self.finished.emit(output_path)
 
-    def get_content_type(self, url):
-        if 'youtube.com' in url or 'youtu.be' in url:
-            return 'youtube'
-        if url.lower().endswith('.pdf'):
-            return 'pdf'
+    async def generate_ai_content(self, model, processed_data):
+        """Generates AI content for every extracted item, at most MAX_CONCURRENT_AI_CALLS at a time."""
+        self.completed_items = 0
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AI_CALLS)
+        await asyncio.gather(
+            *[self.ai_for_item(model, item, semaphore, len(processed_data)) for item in processed_data],
+            return_exceptions=True
+        )
+
+    async def ai_for_item(self, model, item, semaphore, total_items):
         try:
-            res = requests.head(url, headers=self.headers, allow_redirects=True, timeout=10)
-            ct = res.headers.get('Content-Type', '').lower()
-            if 'application/pdf' in ct:
-                return 'pdf'
-            return 'html'
-        except requests.RequestException:
-            try:
-                res = requests.get(url, headers=self.headers, stream=True, allow_redirects=True, timeout=10)
-                ct = res.headers.get('Content-Type', '').lower()
-                if 'application/pdf' in ct:
-                    return 'pdf'
-                return 'html'
-            except requests.RequestException:
-                return 'error'
+            if item.status == "Content Extracted":
+                async with semaphore:
+                    self.log_update.emit(f"Generating AI content for: {item.source_url}")
+                    try:
+                        snippet = await generate_snippet(model, item.title, item.raw_content)
+                    except Exception as e:
+                        item.status = "Error"
+                        item.error_message = f"AI generation failed: {e}"
+                        item.raw_content = ""
+                        self.log_update.emit(f"-> AI generation failed ({item.source_url}): {e}")
+                        return
+                    if snippet:
+                        item.initial_summary = snippet["summary"]
+                        item.seo_keywords = snippet["keywords"]
+                        item.final_summary = snippet["final_summary"]
+                    else:
+                        if model:
+                            self.log_update.emit("-> Structured AI response unavailable, using separate prompts.")
+                        item.initial_summary = get_ai_summary(item.raw_content)
+                        item.seo_keywords = await get_seo_keywords(model, item.title)
+                        item.final_summary = await rewrite_summary_with_seo(model, item.initial_summary, item.seo_keywords)
+                    item.raw_content = ""
+                    item.status = "Processed"
+                    self.log_update.emit(f"-> AI content generated ({item.source_url}).")
+        finally:
+            self.completed_items += 1
+            self.progress_update.emit(50 + int((self.completed_items / total_items) * 50)) # Second 50% for AI tasks
+
+    async def fetch_urls(self):
+        """Fetches every URL concurrently, returning (url_data, pdf_path) pairs in input order."""
+        self.completed_urls = 0
+        self.url_fractions = {} # url -> downloaded fraction of each PDF still in flight
+        semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        async with self.client:
+            tasks = [
+                asyncio.create_task(self.process_one(self.client, semaphore, i, url))
+                for i, url in enumerate(self.urls)
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def process_one(self, client, semaphore, i, url):
+        total_urls = len(self.urls)
+        try:
+            async with semaphore:
+                self.log_update.emit(f"({i+1}/{total_urls}) Processing URL: {url}")
+                content_type = await get_content_type(client, url, log=self.log_update.emit)
+
+                url_data = UrlData(source_url=url, content_type=content_type)
+                filepath = None
+
+                if content_type == 'html':
+                    self.log_update.emit(f"-> Type: Web Page ({url})")
+                    title, content, error = await self.extract_html_content(client, url)
+                    if error:
+                        url_data.status = "Error"
+                        url_data.error_message = error
+                        self.log_update.emit(f"-> Error: {error}")
+                    else:
+                        url_data.title = title
+                        url_data.raw_content = content
+                        url_data.status = "Content Extracted"
+                        self.log_update.emit(f"-> Content extracted successfully ({url}).")
+                elif content_type == 'pdf':
+                    self.log_update.emit(f"-> Type: PDF Document ({url})")
+                    filepath, error = await self.download_pdf(
+                        client, url, TEMP_DIR,
+                        progress_cb=lambda written, total: self.on_download_bytes(url, written, total)
+                    )
+                    if error:
+                        url_data.status = "Error"
+                        url_data.error_message = f"Failed to download PDF: {error}"
+                        self.log_update.emit(f"-> Error downloading PDF: {error}")
+                    else:
+                        self.log_update.emit(f"-> PDF downloaded to: {filepath}")
+                        url_data.status = "Downloaded"
+                elif content_type == 'youtube':
+                    self.log_update.emit(f"-> Type: YouTube Video ({url})")
+                    title, content, error = await self.extract_youtube_content(client, url)
+                    if error:
+                        url_data.status = "Error"
+                        url_data.error_message = error
+                        self.log_update.emit(f"-> Error: {error}")
+                    else:
+                        url_data.title = title
+                        url_data.raw_content = content
+                        url_data.status = "Content Extracted"
+                        self.log_update.emit(f"-> Content extracted successfully ({url}).")
+                else:
+                    self.log_update.emit(f"-> Type: Unknown or Error ({url})")
+                    url_data.status = "Error"
+                    url_data.error_message = "Could not determine content type or URL is unreachable."
+
+                return url_data, filepath
+        finally:
+            self.url_fractions.pop(url, None)
+            self.completed_urls += 1
+            self.emit_fetch_progress()
+
+    def on_download_bytes(self, url, bytes_written, content_length):
+        self.byte_progress.emit(url, bytes_written, content_length)
+        if content_length:
+            # Compressed transfers can decode to more bytes than Content-Length
+            self.url_fractions[url] = min(bytes_written / content_length, 1.0)
+            self.emit_fetch_progress()
+
+    def emit_fetch_progress(self):
+        done = self.completed_urls + sum(self.url_fractions.values())
+        self.progress_update.emit(int((done / len(self.urls)) * 50)) # First 50% for download/extract
 
     def extract_video_id_from_url(self, url):
         """Extracts the YouTube video ID from a URL."""
@@ -227,74 +459,64 @@ class AgentWorker(QThread):
             return parsed_url.path[1:]
         return None
 
-    def extract_html_content(self, url):
+    async def extract_html_content(self, client, url, max_chars=MAX_CONTENT_CHARS):
         try:
-            res = requests.get(url, headers=self.headers, timeout=15)
-            res.raise_for_status()
-            soup = BeautifulSoup(res.content, 'html.parser')
-            title = soup.find('title').get_text(strip=True) if soup.find('title') else "No Title"
-            main = soup.find('article') or soup.find('main') or soup.find('div', class_='content')
-            content = main.get_text('\n', strip=True) if main else soup.get_text('\n', strip=True)
-            return title, content, None
-        except requests.RequestException as e: return None, None, str(e)
-
-    def extract_youtube_content(self, url):
+            async with request_with_retry(client, 'GET', url, timeout=15) as res:
+                body = await res.aread()
+            tree = HTMLParser(body)
+            tree.strip_tags(['script', 'style'])
+            title_node = tree.css_first('title')
+            title = title_node.text(strip=True) if title_node else "No Title"
+            main = find_main_content(tree) or tree.body or tree.root
+            content = main.text(separator='\n', strip=True)
+            return title, content[:max_chars], None
+        except httpx.HTTPError as e: return None, None, str(e) or type(e).__name__
+
+    async def extract_youtube_content(self, client, url, max_chars=MAX_CONTENT_CHARS):
         try:
             video_id = self.extract_video_id_from_url(url)
 
             if not video_id:
                 return None, None, "Could not extract video ID from URL."
 
-            # Get transcript
-            transcript_list = YouTubeTranscriptApi().list(video_id)
-            transcript = transcript_list.find_transcript(['en'])
-            transcript_text = " ".join([item.text for item in transcript.fetch()])
+            # Get transcript (youtube-transcript-api is blocking, so run it off the event loop)
+            transcript_text = await asyncio.to_thread(fetch_transcript, video_id, max_chars)
 
-            # Scrape title from YouTube page
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            title = soup.find('meta', property='og:title')
-            title = title['content'] if title else "No Title Found"
+            title = await fetch_youtube_title(client, url)
 
             return title, transcript_text, None
         except Exception as e:
             return None, None, str(e)
 
-    def download_pdf(self, url, folder):
+    async def download_pdf(self, client, url, folder, progress_cb=None):
         try:
-            res = requests.get(url, headers=self.headers, stream=True, timeout=20)
-            res.raise_for_status()
-            fname = os.path.basename(urlparse(url).path)
-            fpath = os.path.join(folder, fname)
-            with open(fpath, 'wb') as f:
-                for chunk in res.iter_content(chunk_size=8192): f.write(chunk)
+            async with request_with_retry(client, 'GET', url, timeout=20) as res:
+                fpath = pdf_download_path(url, folder)
+                content_length = int(res.headers.get('Content-Length') or 0)
+                written = 0
+                with open(fpath, 'wb') as f:
+                    async for chunk in res.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+                        if progress_cb: progress_cb(written, content_length)
             return fpath, None
-        except requests.RequestException as e: return None, str(e)
+        except httpx.HTTPError as e: return None, str(e) or type(e).__name__
 
-    def extract_pdf_content(self, fpath):
+    def extract_pdf_content(self, fpath, max_chars=MAX_CONTENT_CHARS):
         try:
-            with open(fpath, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                meta = reader.metadata
-                title = meta.title if meta and meta.title else os.path.basename(fpath).rsplit('.', 1)[0]
-                content = "".join(page.extract_text() for page in reader.pages)
+            pdf = pdfium.PdfDocument(fpath)
+            try:
+                title = pdf.get_metadata_dict().get("Title") or os.path.basename(fpath).rsplit('.', 1)[0]
+                content = extract_pdf_text(pdf, max_chars)
                 return title, content, None
+            finally:
+                pdf.close()
         except Exception as e: return None, None, str(e)
 
     def save_as_word_doc(self, data, fname):
         doc = Document()
         doc.add_heading('AI Generated Snippets', level=1)
-        for item in data:
-            if item["status"] == "Processed":
-                doc.add_heading(f"URL: {item['source_url']}", level=2)
-                doc.add_heading('Title', level=3)
-                doc.add_paragraph(item["title"])
-                doc.add_heading('SEO Keywords', level=3)
-                doc.add_paragraph(', '.join(item["seo_keywords"]))
-                doc.add_heading('Final Summary', level=3)
-                doc.add_paragraph(item["final_summary"])
-                doc.add_page_break()
+        append_snippets(doc, data)
         try:
             doc.save(fname)
         except Exception as e:
@@ -340,9 +562,18 @@ class SnippetAgentFrontend(QMainWindow):
         self.worker = AgentWorker(urls)
         self.worker.progress_update.connect(self.progress_bar.setValue)
         self.worker.log_update.connect(self.log_display.append)
+        self.worker.byte_progress.connect(self.show_download_progress)
         self.worker.finished.connect(self.on_processing_finished)
         self.worker.start()
 
+    def show_download_progress(self, url, bytes_written, content_length):
+        name = os.path.basename(urlparse(url).path) or url
+        if content_length:
+            message = f"Downloading {name}: {bytes_written / 1e6:.1f} / {content_length / 1e6:.1f} MB"
+        else:
+            message = f"Downloading {name}: {bytes_written / 1e6:.1f} MB"
+        self.statusBar().showMessage(message, 3000)
+
     def on_processing_finished(self, output_path):
         self.log_display.append(f"\nProcessing complete! Output saved to: {output_path}")
         self.start_button.setEnabled(True)